@@ -10,6 +10,7 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+from .asyncInterface import AsyncInterface
 from .cmeError import CmeError
 from .cmsError import CmsError
 from .interface import Interface
@@ -17,6 +18,7 @@ from .response import Response
 from .result import Result
 
 __all__ = [
+    "AsyncInterface",
     "CmeError",
     "CmsError",
     "Interface",
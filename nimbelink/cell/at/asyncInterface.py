@@ -0,0 +1,226 @@
+"""
+Uses a modem's AT interface from asyncio
+
+(C) NimbeLink Corp. 2021
+
+All rights reserved except as explicitly granted in the license agreement
+between NimbeLink Corp. and the designated licensee. No other use or disclosure
+of this software is permitted. Portions of this software may be subject to third
+party license terms as specified in this software, and such portions are
+excluded from the preceding copyright notice of NimbeLink Corp.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import re
+import typing
+
+from .interface import Interface
+from .response import Response
+
+class AsyncInterface(object):
+    """Python class for using an AT interface from asyncio
+
+    Each operation runs the AT interface's own operation on the AT interface's
+    single worker thread, which keeps everything for a modem in order -- even
+    alongside its asyncio sockets -- while letting the event loop carry on with
+    other work, including other modems.
+    """
+
+    def __init__(
+        self,
+        interface: Interface,
+        executor: concurrent.futures.Executor = None
+    ) -> None:
+        """Creates a new asyncio AT interface
+
+        :param self:
+            Self
+        :param interface:
+            The AT interface to use
+        :param executor:
+            The executor to run AT operations on, if not the AT interface's own
+            worker
+
+        :return none:
+        """
+
+        self.interface: Interface = interface
+
+        self._executor: typing.Optional[concurrent.futures.Executor] = executor
+
+    async def _run(self, function: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Runs an AT operation on our executor
+
+        :param self:
+            Self
+        :param function:
+            The operation to run
+        :param *args:
+            Positional arguments for the operation
+        :param **kwargs:
+            Keyword arguments for the operation
+
+        :return typing.Any:
+            The operation's result
+        """
+
+        executor = self._executor
+
+        # Look up the AT interface's worker every time, as it's the AT
+        # interface's to shut down and replace
+        if executor is None:
+            executor = self.interface.executor
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(function, *args, **kwargs)
+        )
+
+    async def sendCommand(self, command: str, timeout: float = None) -> Response:
+        """Sends a command to the AT interface
+
+        :param self:
+            Self
+        :param command:
+            Command to send
+        :param timeout:
+            How long to wait for the response, if any
+
+        :raise CommError:
+            Timed out sending command or waiting for response
+
+        :return Response:
+            The response
+        """
+
+        return await self._run(self.interface.sendCommand, command = command, timeout = timeout)
+
+    async def sendCommands(
+        self,
+        commands: typing.Sequence[str],
+        timeout: float = None
+    ) -> typing.List[Response]:
+        """Sends several commands to the AT interface at once
+
+        :param self:
+            Self
+        :param commands:
+            Commands to send
+        :param timeout:
+            How long to wait for each response, if any
+
+        :raise CommError:
+            Timed out sending commands or waiting for a response
+
+        :return List[Response]:
+            The responses, in the same order as the commands
+        """
+
+        return await self._run(self.interface.sendCommands, commands = commands, timeout = timeout)
+
+    async def waitForPattern(
+        self,
+        pattern: typing.Union[str, bytes, typing.Pattern],
+        timeout: float = None
+    ) -> bool:
+        """Waits until a desired string is seen in the output from the device
+
+        :param self:
+            Self
+        :param pattern:
+            The regular expression pattern to wait for
+        :param timeout:
+            How long to wait for a given pattern
+
+        :return bool:
+            Whether or not the desired pattern was produced in the given time
+        """
+
+        return await self._run(self.interface.waitForPattern, pattern = pattern, timeout = timeout)
+
+    async def getUrc(
+        self,
+        pattern: typing.Union[str, typing.Pattern] = None,
+        timeout: float = None
+    ) -> str:
+        """Waits for an asynchronous output
+
+        :param self:
+            Self
+        :param pattern:
+            A pattern for filtering URCs
+        :param timeout:
+            How long to wait for a new URC
+
+        :raise CommError:
+            Timed out waiting for URC
+
+        :return String:
+            The URC, sans line endings
+        """
+
+        return await self._run(self.interface.getUrc, pattern = pattern, timeout = timeout)
+
+    async def getAnyUrc(
+        self,
+        patterns: typing.Sequence[typing.Union[str, typing.Pattern]],
+        timeout: float = None
+    ) -> typing.Tuple[int, str]:
+        """Waits for an asynchronous output matching any of several patterns
+
+        :param self:
+            Self
+        :param patterns:
+            The patterns for filtering URCs
+        :param timeout:
+            How long to wait for a new URC
+
+        :raise CommError:
+            Timed out waiting for URC
+
+        :return Tuple[int, String]:
+            The index of the pattern that matched, and the URC, sans line
+            endings
+        """
+
+        return await self._run(self.interface.getAnyUrc, patterns = patterns, timeout = timeout)
+
+    async def getUrcs(
+        self,
+        pattern: typing.Union[str, typing.Pattern] = None,
+        timeout: float = None
+    ) -> typing.AsyncGenerator[str, None]:
+        """Waits for multiple asynchronous output
+
+        The worker thread is only busy while waiting for each URC, so other
+        operations can be run between them.
+
+        :param self:
+            Self
+        :param pattern:
+            A pattern for filtering URCs
+        :param timeout:
+            How long to wait for a new URC
+
+        :yield String:
+            The URC, sans line endings
+
+        :return none:
+        """
+
+        # Compile the pattern once for all of the URCs
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        while True:
+            # Get another URC
+            try:
+                urc = await self.getUrc(pattern = pattern, timeout = timeout)
+
+            # If that failed, we're done
+            except Interface.CommError:
+                break
+
+            yield urc
@@ -89,11 +89,7 @@ class CmeError:
             The name of the code
         """
 
-        for mapping in CmeError.__dict__.items():
-            if mapping[1] == code:
-                return mapping[0]
-
-        return None
+        return CmeError._names.get(code)
 
     @staticmethod
     def getCode(name):
@@ -108,8 +104,12 @@ class CmeError:
             The code for the name
         """
 
-        for mapping in CmeError.__dict__.items():
-            if mapping[0] == name:
-                return mapping[1]
+        return CmeError._codes.get(name)
+
+# Build our name and code lookups once, rather than searching for them each time
+CmeError._codes = {
+    name: code for name, code in vars(CmeError).items()
+    if not name.startswith("_") and isinstance(code, int)
+}
 
-        return None
+CmeError._names = {code: name for name, code in CmeError._codes.items()}
@@ -114,11 +114,7 @@ class CmsError:
             The name of the code
         """
 
-        for mapping in CmsError.__dict__.items():
-            if mapping[1] == code:
-                return mapping[0]
-
-        return None
+        return CmsError._names.get(code)
 
     @staticmethod
     def getCode(name):
@@ -133,8 +129,12 @@ class CmsError:
             The code for the name
         """
 
-        for mapping in CmsError.__dict__.items():
-            if mapping[0] == name:
-                return mapping[1]
+        return CmsError._codes.get(name)
+
+# Build our name and code lookups once, rather than searching for them each time
+CmsError._codes = {
+    name: code for name, code in vars(CmsError).items()
+    if not name.startswith("_") and isinstance(code, int)
+}
 
-        return None
+CmsError._names = {code: name for name, code in CmsError._codes.items()}
@@ -10,8 +10,10 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+import concurrent.futures
 import logging
 import re
+import selectors
 import serial
 import time
 import typing
@@ -38,6 +40,18 @@ class Interface(object):
     NewLine: str = Response.DefaultNewLine
     """The line endings to expect"""
 
+    CommandPrefix: bytes = b"AT"
+    """The start of every command we send"""
+
+    CommandPrefixes: typing.Tuple[str, ...] = ("AT", "At", "aT", "at")
+    """The ways a command we're given might already start with 'AT'"""
+
+    ClearTimeout: float = 0.01
+    """How long to wait for stray data when clearing our buffers"""
+
+    ClearAttempts: int = 4
+    """The most reads of stray data to make when clearing our buffers"""
+
     def __init__(self, *args, **kwargs):
         """Creates a new AT interface
 
@@ -63,8 +77,24 @@ class Interface(object):
 
         self._buffer = bytearray()
 
+        # Our sending line ending(s), ready to go out with each command
+        self._sendNewLine: bytes = self.SendNewLine.encode()
+
+        # A buffer for assembling outgoing commands
+        self._commandBuffer: bytearray = bytearray()
+
         self.writeTimeout: float = 0
 
+        # Try to have small responses delivered promptly
+        self._setLowLatency()
+
+        # Try to be able to wait for input without changing the port's timeout
+        self._selector: typing.Optional[selectors.BaseSelector] = self._makeSelector()
+
+        # The worker for running our operations away from asyncio, made when
+        # first needed
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+
         # Clear out device's buffers to begin with
         self._clear()
 
@@ -82,6 +112,101 @@ class Interface(object):
 
         return self._device
 
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """Gets the worker for running our operations from asyncio
+
+        Everything using this interface from asyncio should share this single
+        worker thread, so only one operation is ever talking to the device at a
+        time.
+
+        :param self:
+            Self
+
+        :return concurrent.futures.Executor:
+            Our worker
+        """
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+
+        return self._executor
+
+    def closeExecutor(self) -> None:
+        """Shuts down our worker for asyncio operations, if we made one
+
+        Any operations already given to the worker are finished first. A new
+        worker will be made if one is needed again.
+
+        :param self:
+            Self
+
+        :return none:
+        """
+
+        if self._executor is None:
+            return
+
+        executor = self._executor
+        self._executor = None
+
+        executor.shutdown()
+
+    def _setLowLatency(self) -> None:
+        """Tries to put our device in low latency mode
+
+        USB serial adapters -- such as the FTDI parts on development kits -- can
+        otherwise hold on to small amounts of received data for several
+        milliseconds, which adds up quickly when each AT command's response is
+        only a few bytes. Not every platform or port supports this, so failing
+        to do it is not an error.
+
+        :param self:
+            Self
+
+        :return none:
+        """
+
+        try:
+            self._device.set_low_latency_mode(True)
+
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            self._logger.debug("Low latency mode not available: %s", e)
+
+    def _makeSelector(self) -> typing.Optional[selectors.BaseSelector]:
+        """Makes a selector for waiting on our device's input
+
+        Not every serial port has a file descriptor that can be waited on --
+        notably on Windows -- in which case we'll just rely on the port's read
+        timeout.
+
+        :param self:
+            Self
+
+        :return None:
+            Our device can't be waited on
+        :return selectors.BaseSelector:
+            The selector
+        """
+
+        selector = None
+
+        try:
+            fileno = self._device.fileno()
+
+            selector = selectors.DefaultSelector()
+            selector.register(fileno, selectors.EVENT_READ)
+
+            return selector
+
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            self._logger.debug("Input selector not available: %s", e)
+
+            if selector is not None:
+                selector.close()
+
+            return None
+
     def _clear(self) -> None:
         """Clears our device's input/output buffers
 
@@ -91,12 +216,25 @@ class Interface(object):
         :return none:
         """
 
-        while True:
-            self._device.reset_output_buffer()
-            self._device.reset_input_buffer()
+        self._device.reset_output_buffer()
+        self._device.reset_input_buffer()
 
-            if len(self._device.read_all()) < 1:
-                break
+        self._buffer.clear()
+
+        # Something might have still been on its way in, so briefly drain
+        # anything else that shows up, but don't keep at it forever if the
+        # device is chattering
+        #
+        # If we can wait on the port directly, this won't touch its timeout.
+        timeout = self.readTimeout
+
+        try:
+            for _ in range(Interface.ClearAttempts):
+                if len(self._readWaiting(timeout = Interface.ClearTimeout)) < 1:
+                    break
+
+        finally:
+            self.readTimeout = timeout
 
     @property
     def readTimeout(self) -> float:
@@ -196,7 +334,7 @@ class Interface(object):
             Whether or not RTS/CTS flow control is on
         """
 
-        return self._device.baudrate
+        return self._device.rtscts
 
     @flowControl.setter
     def flowControl(self, flowControl: bool) -> None:
@@ -235,46 +373,73 @@ class Interface(object):
         if timeout is None:
             timeout = Interface.DefaultTimeout
 
-        self.readTimeout = timeout
+        # Keep what we use on every pass close at hand
+        readWaiting = self._readWaiting
+        buffer = self._buffer
+        logger = self._logger
+
+        # How much of the buffer we already know doesn't have a newline
+        searched: int = 0
 
-        # Allow a zero-second timeout to still potentially read input
-        startTime: float = None
+        # Use a monotonic clock, so changes to the system time can't cut our
+        # wait short or stretch it out
+        deadline: float = time.monotonic() + timeout
 
         while True:
-            now = time.time()
+            end = buffer.find(b"\n", searched)
 
-            # If this is our first time through, note when we started
-            if startTime is None:
-                startTime = now
+            # If we don't already have a whole line, read whatever has arrived
+            # -- waiting for at least a byte -- and look again, but only in the
+            # new data
+            #
+            # This avoids readline(), which reads a single byte at a time. A
+            # zero-second timeout still gets to read what's already there.
+            if end < 0:
+                searched = len(buffer)
 
-            # If we've timed out, stop
-            if (now - startTime) > timeout:
-                break
+                remaining: float = deadline - time.monotonic()
 
-            # Get another line of text
-            self._buffer.extend(self._device.readline())
+                buffer.extend(readWaiting(timeout = max(0, remaining)))
 
-            # If the data doesn't actually contain a newline, keep waiting
-            #
-            # There appear to be issues with readline() that aren't strictly
-            # documented, where it's ending and returning a non-empty buffer
-            # that *doesn't* contain a newline in it.
-            if self._buffer.rfind(b"\n") < 0:
-                continue
+                end = buffer.find(b"\n", searched)
 
-            # We need to clear our buffer before yielding, as we can't guarantee
-            # the caller will re-enter the function again
-            buffer = self._buffer
+            # If the data doesn't contain a newline yet, keep waiting, unless
+            # we've timed out
+            if end < 0:
+                searched = len(buffer)
 
-            # We consumed a whole line, so start over
-            self._buffer = bytearray()
+                if remaining <= 0:
+                    break
 
-            self._logger.debug(f"Read  {ascii(buffer.decode())}")
+                continue
+
+            # Decode the line straight out of our buffer, without copying it
+            # first
+            #
+            # Any bytes that aren't valid UTF-8 are kept as surrogates, so
+            # binary data in a line can be encoded back to the exact bytes we
+            # read.
+            with memoryview(buffer) as view:
+                line = str(view[:end + 1], "utf-8", "surrogateescape")
+
+            # We need to take the line out of our buffer before yielding, as we
+            # can't guarantee the caller will re-enter the function again
+            #
+            # Dropping data from the front of a bytearray just moves its start,
+            # so this doesn't shuffle the rest of the data around.
+            del buffer[:end + 1]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Read  %s", ascii(line))
 
             # Got another line
-            yield buffer.decode()
+            yield line
+
+            # Anything could have happened to the buffer while we were away, so
+            # search it from the start next time
+            searched = 0
 
-    def _writeRaw(self, data: typing.Union[bytes, bytearray]) -> None:
+    def _writeRaw(self, data: typing.Union[bytes, bytearray, memoryview]) -> None:
         """Writes raw data
 
         :param self:
@@ -289,11 +454,16 @@ class Interface(object):
         """
 
         if self._device.write(data) != len(data):
-            raise Interface.CommError(f"Failed to send {ascii(data.decode())}")
+            text = bytes(data).decode(errors = "replace")
 
-        self._logger.debug(f"Wrote {ascii(data.decode())}")
+            raise Interface.CommError(f"Failed to send {ascii(text)}")
 
-    def _readRaw(self, size: int, timeout: float = None) -> bytes:
+        # Only copy and decode the data for logging if anyone will see it, as
+        # it could be a large payload
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Wrote %s", ascii(bytes(data).decode(errors = "replace")))
+
+    def _readRaw(self, size: int, timeout: float = None) -> bytearray:
         """Read raw bytes from the serial device connected to the modem
 
         Less data may be returned than desired.
@@ -305,25 +475,209 @@ class Interface(object):
         :param timeout:
             The longest we should wait for more data if we don't have enough
 
-        :return bytes:
+        :return bytearray:
             The data that was read from the serial port
         """
 
+        # Read straight into the buffer we'll hand back, rather than having
+        # the serial port make its own for us to copy from
+        data = bytearray(size)
+
+        size = self._readRawInto(data, timeout)
+
+        # Return the bytes that were read, even if there are less than desired
+        del data[size:]
+
+        return data
+
+    def _readRawInto(self, buffer: typing.Union[bytearray, memoryview], timeout: float = None) -> int:
+        """Reads raw bytes from the serial device directly into a buffer
+
+        Less data may be read than the buffer can hold.
+
+        :param self:
+            Self
+        :param buffer:
+            The writable buffer to read into, whose size is the amount of data
+            to attempt to read from the serial port
+        :param timeout:
+            The longest we should wait for more data if we don't have enough
+
+        :return int:
+            The number of bytes that were read from the serial port
+        """
+
         # If the user didn't specify a timeout, just use the default timeout
         if timeout is None:
             timeout = Interface.DefaultTimeout
 
-        # Set the read timeout of the device to the desired length
-        self.readTimeout = timeout
+        # Start with anything we already read but haven't used yet
+        size: int = min(len(buffer), len(self._buffer))
 
-        # Attempt to read the desired number of bytes from the serial port
-        data: bytes = self._device.read(size)
+        buffer[:size] = self._buffer[:size]
 
-        self._logger.debug(f"Read {ascii(data.decode())}")
+        del self._buffer[:size]
+
+        # If we need more, attempt to fill the rest from the serial port
+        if size < len(buffer):
+            with memoryview(buffer) as view:
+                size += self._fillFromDevice(view[size:], timeout)
+
+        # Only copy and decode the data for logging if anyone will see it
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Read %s", ascii(bytes(buffer[:size]).decode(errors = "replace")))
+
+        # Return how many bytes were read, even if there are less than desired
+        return size
+
+    def _fillFromDevice(self, view: memoryview, timeout: float) -> int:
+        """Fills a buffer straight from the serial port
+
+        If we can wait on the port directly, we do so and only ever take what is
+        already there, which leaves the port's read timeout alone. Otherwise,
+        the port's read timeout is used.
+
+        :param self:
+            Self
+        :param view:
+            The writable buffer to fill
+        :param timeout:
+            The longest we should wait for more data if we don't have enough
+
+        :return int:
+            The number of bytes that were read from the serial port
+        """
+
+        if self._selector is None:
+            # Set the read timeout of the device to the desired length
+            self.readTimeout = timeout
+
+            return self._device.readinto(view)
+
+        size: int = 0
+
+        deadline: float = time.monotonic() + timeout
+
+        while size < len(view):
+            waiting = min(self._device.in_waiting, len(view) - size)
+
+            # If nothing is there yet, wait for something to show up
+            if waiting < 1:
+                remaining: float = deadline - time.monotonic()
+
+                if (remaining <= 0) or not self._selector.select(timeout = remaining):
+                    break
+
+                continue
+
+            size += self._device.readinto(view[size:size + waiting])
+
+        return size
+
+    def _readAvailable(self, timeout: float) -> bytes:
+        """Reads whatever data is available
+
+        Anything we already read but haven't used yet is returned first.
+        Otherwise, this waits for at least one byte and then takes everything
+        else that has arrived along with it.
+
+        :param self:
+            Self
+        :param timeout:
+            The longest we should wait for data
+
+        :return bytes:
+            The data that was read, which might be empty
+        """
+
+        # If we already have data, use that
+        if len(self._buffer) > 0:
+            data = bytes(self._buffer)
+
+            self._buffer.clear()
+
+            return data
+
+        data = self._readWaiting(timeout = timeout)
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Read %s", ascii(data.decode(errors = "replace")))
 
-        # Return the bytes that were read, even if there are less than desired
         return data
 
+    def _readWaiting(self, timeout: float) -> bytes:
+        """Reads whatever data the serial port has, waiting for some if needed
+
+        If we can wait on the port directly, we do so and then only take what
+        is already there, which leaves the port's read timeout alone.
+        Otherwise, the port's read timeout is used to wait for at least a byte.
+
+        :param self:
+            Self
+        :param timeout:
+            The longest we should wait for data
+
+        :return bytes:
+            The data that was read, which might be empty
+        """
+
+        if self._selector is None:
+            self.readTimeout = timeout
+
+            return self._device.read(max(1, self._device.in_waiting))
+
+        waiting = self._device.in_waiting
+
+        # If nothing is there yet, wait for something to show up
+        if waiting < 1:
+            if not self._selector.select(timeout = timeout):
+                return b""
+
+            waiting = self._device.in_waiting
+
+        return self._device.read(waiting)
+
+    def _unread(self, data: typing.Union[bytes, bytearray]) -> None:
+        """Puts data back to be read again
+
+        :param self:
+            Self
+        :param data:
+            The data to put back
+
+        :return none:
+        """
+
+        self._buffer[:0] = data
+
+    def _dropLines(self) -> None:
+        """Drops any whole lines that have already arrived
+
+        This only takes what the serial port already has waiting, so it never
+        blocks and doesn't need to change the port's timeout. A partial line is
+        kept.
+
+        :param self:
+            Self
+
+        :return none:
+        """
+
+        waiting = self._device.in_waiting
+
+        if waiting > 0:
+            self._buffer.extend(self._device.read(waiting))
+
+        end = self._buffer.rfind(b"\n")
+
+        if end < 0:
+            return
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Dropped %s", ascii(self._buffer[:end + 1].decode(errors = "replace")))
+
+        del self._buffer[:end + 1]
+
     def _beginCommand(self, command: str) -> None:
         """Sends a command to the AT interface without expecting a response
 
@@ -336,25 +690,41 @@ class Interface(object):
         :return none:
         """
 
-        # First try to have locked control over the interface by sending the
-        # 'AT'
-        self._writeRaw("AT".encode())
+        self._beginCommands(commands = [command])
 
-        # Handle any buffered URCs, which -- since we entered the 'AT' -- we
-        # expect to not show up anymore until we're done with the command's full
-        # entry and response
-        for line in self._getLines(timeout = 0):
-            pass
+    def _beginCommands(self, commands: typing.Sequence[str]) -> None:
+        """Sends commands to the AT interface without expecting responses
+
+        :param commands:
+            Commands to send
+
+        :raise CommError:
+            Failed to send commands
+
+        :return none:
+        """
+
+        # Handle any buffered URCs before we start, so they don't get mixed up
+        # with the commands' responses
+        self._dropLines()
 
-        # Drop the command's 'AT', if any
-        if command[:2].upper() == "AT":
-            command = command[2:]
+        buffer = self._commandBuffer
 
-        # Add our sending line ending(s)
-        command = command + self.SendNewLine
+        buffer.clear()
 
-        # Write the command
-        self._writeRaw(command.encode())
+        for command in commands:
+            # Drop the command's 'AT', if any
+            if command.startswith(Interface.CommandPrefixes):
+                command = command[2:]
+
+            # Add the whole command, with its 'AT' and our sending line
+            # ending(s)
+            buffer += Interface.CommandPrefix
+            buffer += command.encode()
+            buffer += self._sendNewLine
+
+        # Write everything in one go
+        self._writeRaw(buffer)
 
     def _waitForResponse(self, command, timeout: float = None) -> Response:
         """Waits for a certain response
@@ -373,18 +743,11 @@ class Interface(object):
             The response
         """
 
-        data = ""
+        builder = Response.Builder(command = command, newLine = self.NewLine)
 
         for line in self._getLines(timeout = timeout):
-            # Note the additional contents
-            data += line
-
-            # Try to get a response from that
-            response = Response.makeFromString(
-                string = data,
-                command = command,
-                newLine = self.NewLine
-            )
+            # Note the additional contents and try to get a response from them
+            response = builder.feed(line)
 
             # If this is a final result, return it
             if response is not None:
@@ -392,12 +755,16 @@ class Interface(object):
 
         raise Interface.CommError("Timeout waiting for response")
 
-    def waitForPattern(self, pattern: typing.Pattern, timeout: float = None) -> bool:
+    def waitForPattern(self, pattern: typing.Union[str, bytes, typing.Pattern], timeout: float = None) -> bool:
         """Waits until a desired string is seen in the output from the device
 
-        This method reads characters one at a time from the serial port and
-        checks whether or not a match for the regular expression pattern exists
-        in the read data.
+        This method reads whatever characters are available from the serial
+        port and checks whether or not a match for the regular expression
+        pattern exists in the read data. Anything read after the match is left
+        to be read again.
+
+        The read data is searched as bytes, so string patterns are converted to
+        their bytes equivalent first. Passing a bytes pattern skips that.
 
         :param self:
             Self
@@ -414,25 +781,109 @@ class Interface(object):
         if timeout is None:
             timeout = Interface.DefaultTimeout
 
+        # Search the raw data rather than decoding it over and over
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern.encode())
+
+        elif isinstance(pattern, bytes):
+            pattern = re.compile(pattern)
+
+        elif isinstance(pattern.pattern, str):
+            pattern = re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+
         buffer: bytearray = bytearray()
 
-        begin: float = time.time()
+        # Keep what we use on every pass close at hand
+        readAvailable = self._readAvailable
+        search = pattern.search
+
+        deadline: float = time.monotonic() + timeout
 
         # While we haven't ran out of time, search for the desired string in the
         # output
-        while begin + timeout > time.time():
+        while True:
+            remaining: float = deadline - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            # Attempt to read whatever is available from the serial port
+            data: bytes = readAvailable(timeout = remaining)
+
+            # If we didn't get anything, there's nothing new to search
+            if not data:
+                continue
+
+            buffer.extend(data)
+
             # Check if the buffer has a match for the pattern anywhere
             #
-            # If the buffer does, then we are done.
-            if re.search(pattern, buffer.decode()):
+            # If the buffer does, then we are done, save for putting back
+            # whatever came after the match.
+            match = search(buffer)
+
+            if match:
+                self._unread(buffer[match.end():])
+
                 return True
 
-            # Attempt to read a single byte from the serial port
-            data: bytes = self._readRaw(1, timeout)
+        # Ran out of time, so return failure
+        return False
+
+    def waitForSuffix(self, suffix: bytes, timeout: float = None) -> bool:
+        """Waits until a literal string is seen in the output from the device
+
+        This is a cheaper alternative to waitForPattern() for when the output
+        being waited for is known exactly. Anything read after the string is
+        left to be read again.
+
+        :param self:
+            Self
+        :param suffix:
+            The literal bytes to wait for
+        :param timeout:
+            How long to wait for the suffix
+
+        :return bool:
+            Whether or not the suffix was produced in the given time
+        """
+
+        # Ensure timeout is set to default if unspecified
+        if timeout is None:
+            timeout = Interface.DefaultTimeout
+
+        buffer: bytearray = bytearray()
+
+        # How much of the buffer we already know doesn't hold the suffix
+        searched: int = 0
 
-            # If we read a byte, append it to the data we previously read
-            if data:
-                buffer.append(data[0])
+        deadline: float = time.monotonic() + timeout
+
+        while True:
+            remaining: float = deadline - time.monotonic()
+
+            if remaining <= 0:
+                break
+
+            # Attempt to read whatever is available from the serial port
+            data: bytes = self._readAvailable(timeout = remaining)
+
+            # If we didn't get anything, there's nothing new to search
+            if not data:
+                continue
+
+            buffer.extend(data)
+
+            # Only search the new data, plus enough of the old data to catch a
+            # suffix that straddles the two
+            end = buffer.find(suffix, searched)
+
+            if end >= 0:
+                self._unread(buffer[end + len(suffix):])
+
+                return True
+
+            searched = max(0, len(buffer) - len(suffix) + 1)
 
         # Ran out of time, so return failure
         return False
@@ -463,12 +914,60 @@ class Interface(object):
         # Wait for a response
         return self._waitForResponse(command = command, timeout = timeout)
 
-    def getUrc(self, pattern: str = None, timeout: float = None) -> str:
+    def sendCommands(self, commands: typing.Sequence[str], timeout: float = None) -> typing.List[Response]:
+        """Sends several commands to the AT interface at once
+
+        All of the commands are written back to back, and then their responses
+        are collected in order, which saves waiting for each response before
+        sending the next command. The modem has to be able to take in commands
+        while it's still handling earlier ones, so only use this with modems
+        known to queue their input.
+
+        As every command is sent before any response is read, a failure waiting
+        for one response doesn't mean the earlier commands didn't take effect.
+        The responses that were received are attached to the raised error as its
+        'responses' list, so the caller can tell which commands completed.
+
+        :param self:
+            Self
+        :param commands:
+            Commands to send
+        :param timeout:
+            How long to wait for each response, if any
+
+        :raise CommError:
+            Timed out sending commands or waiting for a response
+
+        :return List[Response]:
+            The responses, in the same order as the commands
+        """
+
+        # Make sure the commands are stripped of any provided line endings
+        commands = [command.rstrip() for command in commands]
+
+        # Send the commands
+        self._beginCommands(commands = commands)
+
+        responses: typing.List[Response] = []
+
+        # Wait for their responses
+        try:
+            for command in commands:
+                responses.append(self._waitForResponse(command = command, timeout = timeout))
+
+        # If one didn't come, let the caller know which commands did respond
+        except Interface.CommError as e:
+            e.responses = responses
+            raise
+
+        return responses
+
+    def getUrc(self, pattern: typing.Union[str, typing.Pattern] = None, timeout: float = None) -> str:
         """Waits for an asynchronous output
 
-        The pattern string can be a regular expression used to filter out
-        irrelevant URCs. It must be contained on a single line, as URCs are only
-        single lines of text.
+        The pattern can be a regular expression -- either a string or an
+        already-compiled pattern -- used to filter out irrelevant URCs. It must
+        be contained on a single line, as URCs are only single lines of text.
 
         URCs will have their line endings stripped prior to being returned.
 
@@ -486,10 +985,14 @@ class Interface(object):
             The URC, sans line endings
         """
 
+        # Compile the pattern up front rather than for every line
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
         # Get another URC
         for line in self._getLines(timeout = timeout):
             # If a pattern was specified but the URC doesn't match, ignore this
-            if (pattern is not None) and (re.match(pattern, line) is None):
+            if (pattern is not None) and (pattern.match(line) is None):
                 continue
 
             # Got a URC that's wanted
@@ -498,7 +1001,52 @@ class Interface(object):
         # We didn't get the URC in time
         raise Interface.CommError(f"Failed to receive URC matching '{pattern}'")
 
-    def getUrcs(self, pattern: str = None, timeout: float = None) -> typing.Generator[str, None, None]:
+    def getAnyUrc(
+        self,
+        patterns: typing.Sequence[typing.Union[str, typing.Pattern]],
+        timeout: float = None
+    ) -> typing.Tuple[int, str]:
+        """Waits for an asynchronous output matching any of several patterns
+
+        Each line is checked against the patterns in order, and the first one
+        that matches wins. The patterns are compiled once up front, and are
+        used as given, so their groups and flags behave just as they would with
+        getUrc().
+
+        URCs will have their line endings stripped prior to being returned.
+
+        :param self:
+            Self
+        :param patterns:
+            The patterns for filtering URCs
+        :param timeout:
+            How long to wait for a new URC
+
+        :raise CommError:
+            Timed out waiting for URC
+
+        :return Tuple[int, String]:
+            The index of the pattern that matched, and the URC, sans line
+            endings
+        """
+
+        # Compile the patterns up front rather than for every line
+        compiled: typing.List[typing.Pattern] = [
+            re.compile(pattern) if isinstance(pattern, str) else pattern
+            for pattern in patterns
+        ]
+
+        for line in self._getLines(timeout = timeout):
+            for index, pattern in enumerate(compiled):
+                if pattern.match(line) is not None:
+                    return index, line.rstrip()
+
+        # We didn't get the URC in time
+        sources = ", ".join(f"'{pattern.pattern}'" for pattern in compiled)
+
+        raise Interface.CommError(f"Failed to receive URC matching any of {sources}")
+
+    def getUrcs(self, pattern: typing.Union[str, typing.Pattern] = None, timeout: float = None) -> typing.Generator[str, None, None]:
         """Waits for multiple asynchronous output
 
         If a timeout is specified, it will be used for each individual URC as if
@@ -520,6 +1068,10 @@ class Interface(object):
         :return none:
         """
 
+        # Compile the pattern once for all of the URCs
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
         while True:
             # Get another URC
             try:
@@ -531,6 +1083,103 @@ class Interface(object):
             except Interface.CommError:
                 break
 
+    def getUrcsBuffered(
+        self,
+        pattern: typing.Union[str, typing.Pattern] = None,
+        timeout: float = None,
+        maxBatch: int = 64
+    ) -> typing.Generator[str, None, None]:
+        """Waits for multiple asynchronous output, a batch at a time
+
+        This behaves like getUrcs(), but rather than checking lines one by one,
+        it takes up to a batch of whole lines that have arrived and finds all
+        of the matching URCs in them with a single search. This suits streaming
+        a lot of URCs, such as for logging or monitoring.
+
+        :param self:
+            Self
+        :param pattern:
+            A pattern for filtering URCs
+        :param timeout:
+            How long to wait for a new URC
+        :param maxBatch:
+            The most lines to search at once
+
+        :yield String:
+            The URC, sans line endings
+
+        :return none:
+        """
+
+        if timeout is None:
+            timeout = Interface.DefaultTimeout
+
+        if pattern is None:
+            pattern = ""
+
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        # Match the pattern at the start of every line, taking the rest of the
+        # line -- and its ending -- with it
+        #
+        # Requiring the line ending keeps a pattern that can match nothing from
+        # also matching the empty position after the last line.
+        linePattern = re.compile(f"^(?:{pattern.pattern})[^\\n]*\\n", pattern.flags | re.MULTILINE)
+
+        buffer: bytearray = bytearray()
+
+        text: str = ""
+        position: int = 0
+
+        deadline: float = time.monotonic() + timeout
+
+        try:
+            while True:
+                # Find the end of up to a batch's worth of whole lines
+                end = -1
+
+                for _ in range(maxBatch):
+                    nextEnd = buffer.find(b"\n", end + 1)
+
+                    if nextEnd < 0:
+                        break
+
+                    end = nextEnd
+
+                # If we don't have any whole lines, wait for more data
+                if end < 0:
+                    remaining: float = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        break
+
+                    buffer.extend(self._readAvailable(timeout = remaining))
+
+                    continue
+
+                text = buffer[:end + 1].decode(errors = "surrogateescape")
+                position = 0
+
+                del buffer[:end + 1]
+
+                for match in linePattern.finditer(text):
+                    # Note where this URC's line ends, in case we aren't
+                    # re-entered
+                    position = match.end()
+
+                    yield match.group(0).rstrip()
+
+                    # Like getUrcs(), give each URC the full timeout
+                    deadline = time.monotonic() + timeout
+
+                text = ""
+
+        # Put back anything we didn't get to, so it can still be read
+        finally:
+            self._unread(buffer)
+            self._unread(text[position:].encode(errors = "surrogateescape"))
+
     def startPrompt(self, *args, **kwargs) -> "Interface.Prompt":
         """Starts a prompt command
 
@@ -551,6 +1200,12 @@ class Interface(object):
         """A prompt for sending dynamic data in an AT command
         """
 
+        WriteChunkSize: int = 4096
+        """The most data to hand to the serial port in a single write"""
+
+        Terminator: bytes = b"\x1A"
+        """The character ending a dynamic command's data"""
+
         def __init__(self, interface: "Interface", dynamic: bool):
             """Creates a new prompt
 
@@ -621,9 +1276,12 @@ class Interface(object):
             # Send the command
             self._interface._beginCommand(command = command)
 
-        def writeData(self, data: typing.Union[bytes, bytearray]) -> None:
+        def writeData(self, data: typing.Union[bytes, bytearray, memoryview]) -> None:
             """Writes command data
 
+            Large data is written in chunks, so the serial port isn't handed
+            everything at once.
+
             :param self:
                 Self
             :param data:
@@ -635,7 +1293,15 @@ class Interface(object):
             :return none:
             """
 
-            self._interface._writeRaw(data)
+            # If this fits in a single write, just do that
+            if len(data) <= Interface.Prompt.WriteChunkSize:
+                self._interface._writeRaw(data)
+
+                return
+
+            with memoryview(data) as view:
+                for start in range(0, len(view), Interface.Prompt.WriteChunkSize):
+                    self._interface._writeRaw(view[start:start + Interface.Prompt.WriteChunkSize])
 
         def finish(self, timeout: float = None) -> Response:
             """Finishes the prompt
@@ -654,7 +1320,7 @@ class Interface(object):
 
             # If we're a dynamic command, send the terminator
             if self._dynamic:
-                self._interface._writeRaw("\x1A".encode())
+                self._interface._writeRaw(Interface.Prompt.Terminator)
 
             # Wait for a response
             return self._interface._waitForResponse(command = self._command, timeout = timeout)
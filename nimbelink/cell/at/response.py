@@ -21,6 +21,91 @@ class Response(object):
     DefaultNewLine = "\r\n"
     """The default line endings to use"""
 
+    class Builder(object):
+        """Builds a response from output one line at a time
+
+        This produces the same response as makeFromString() would for all of
+        the lines fed so far, but only has to look at each new line as it comes
+        in.
+        """
+
+        ResultStarts: typing.Tuple[str, ...] = ("OK", "ERROR", "CME", "CMS", "+ERROR", "+CME", "+CMS")
+        """The starts of the only lines that can be a final result"""
+
+        def __init__(self, command = None, newLine = None):
+            """Creates a new response builder
+
+            :param self:
+                Self
+            :param command:
+                The command the response is for
+            :param newLine:
+                The newline style to use
+
+            :return none:
+            """
+
+            if newLine is None:
+                newLine = Response.DefaultNewLine
+
+            self._command = command
+            self._newLine = newLine
+
+            self._lines = []
+
+        def feed(self, line: str) -> typing.Optional["Response"]:
+            """Adds another line of output
+
+            :param self:
+                Self
+            :param line:
+                The next line of output, including its line endings
+
+            :return None:
+                No response yet
+            :return Response:
+                The response
+            """
+
+            self._lines.append(line)
+
+            # A result has to be on its own line, following a line ending
+            if (len(self._lines) < 2) or (not self._lines[-2].endswith(self._newLine)):
+                return None
+
+            # Most lines are plain output, so rule those out before trying to
+            # parse a result
+            if not line.startswith(Response.Builder.ResultStarts):
+                return None
+
+            # Drop the result's line endings, if it has them all -- like
+            # makeFromString(), a result ending some other way is still taken
+            # as it is
+            if line.endswith(self._newLine):
+                line = line[:-len(self._newLine)]
+
+            # Make the result from this line
+            result = Result.makeFromString(string = line)
+
+            # If that failed, this isn't the end of the response
+            if result is None:
+                return None
+
+            # Everything before this line -- sans the line endings right
+            # before the result -- is generic output
+            output = "".join(self._lines[:-1])[:-len(self._newLine)]
+
+            # If we're provided a command for context, make sure the output is
+            # stripped of any echoed command characters
+            if self._command is not None:
+                output = Response._filterCommand(command = self._command, output = output)
+
+            return Response(
+                command = self._command,
+                output = output,
+                result = result
+            )
+
     def __init__(self, result, command = None, output = None, newLine = None):
         """Creates a response
 
@@ -100,17 +185,18 @@ class Response(object):
             Us
         """
 
-        string = ""
+        # Join the pieces once, rather than copying a growing string for each
+        parts = []
 
         if len(self.command) > 0:
-            string += self.command + self._newLine
+            parts.append(self.command)
 
         if len(self.output) > 0:
-            string += self.output + self._newLine
+            parts.append(self.output)
 
-        string += f"{self.result}"
+        parts.append(f"{self.result}")
 
-        return string
+        return self._newLine.join(parts)
 
     def __contains__(self, item: typing.Union[str, bytes]) -> bool:
         """Checks if the response contains a string
@@ -141,11 +227,11 @@ class Response(object):
             The filtered output
         """
 
-        # Try to filter out the command itself, if present
-        commandStart = output.find(command)
-
-        # If the command wasn't echoed back, nothing to do
-        if commandStart == -1:
+        # The echoed command, if any, comes first, so there's no need to search
+        # the rest of the output for it
+        #
+        # If the command wasn't echoed back, nothing to do.
+        if not output.startswith(command):
             return output
 
         # Skip over the command and the line endings automatically appended
@@ -173,11 +173,14 @@ class App(skywire.App):
 
         applying = False
 
+        # Whatever happens, our apps' versions may no longer be accurate
+        self.invalidate()
+
         # Wait for a final DFU URC
         #
         # URCs should come somewhat readily until it's being applied, but we'll
         # be a little flexible to handle poorer network connections.
-        for urc in self._nano.at.getUrcs(pattern = "DFU: ", timeout = 30):
+        for urc in self._nano.at.getUrcs(pattern = Urcs.Dfu.Pattern, timeout = 30):
             # Parse the DFU URC
             dfu = Urcs.Dfu.makeFromString(string = urc)
 
@@ -216,7 +219,7 @@ class App(skywire.App):
         # We can't know for sure how many pending updates there are, so we
         # should spend some time trying to collect any and all DFU URCs to make
         # sure there weren't any failures.
-        for urc in self._nano.at.getUrcs(pattern = "DFU: ", timeout = 2):
+        for urc in self._nano.at.getUrcs(pattern = Urcs.Dfu.Pattern, timeout = 2):
             # Parse the DFU URC
             dfu = Urcs.Dfu.makeFromString(string = urc)
 
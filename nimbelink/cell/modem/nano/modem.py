@@ -10,7 +10,9 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+import re
 import serial
+import typing
 
 import nimbelink.cell.at as at
 import nimbelink.cell.modem as modem
@@ -26,6 +28,15 @@ class SkywireNano(skywire.Skywire):
     """A Skywire modem
     """
 
+    ReadyPattern: typing.Pattern = re.compile(r".*READY")
+    """The pattern for the URC indicating we've booted"""
+
+    ResetPattern: typing.Pattern = re.compile(r"\+RESET")
+    """The pattern for the URC indicating we're rebooting"""
+
+    ShutdownPattern: typing.Pattern = re.compile(r"\+SHUTDOWN")
+    """The pattern for the URC indicating we've shut down"""
+
     def __init__(
         self,
         interface: at.Interface,
@@ -77,7 +88,7 @@ class SkywireNano(skywire.Skywire):
             timeout = 5
 
         try:
-            self.at.getUrc(pattern = r".*READY", timeout = timeout)
+            self.at.getUrc(pattern = SkywireNano.ReadyPattern, timeout = timeout)
 
         except at.Interface.CommError:
             raise modem.AtError(None, "Failed to detect boot")
@@ -102,7 +113,7 @@ class SkywireNano(skywire.Skywire):
 
         # Wait for the +RESET URC
         try:
-            self.at.getUrc(pattern = r"\+RESET")
+            self.at.getUrc(pattern = SkywireNano.ResetPattern)
         except at.Interface.CommError:
             raise modem.AtError(None, "Failed to get +RESET URC")
 
@@ -118,15 +129,42 @@ class SkywireNano(skywire.Skywire):
         :return none:
         """
 
+        self._startShutdown()
+        self._finishShutdown()
+
+    def _startShutdown(self) -> None:
+        """Tells the modem to gracefully shut down
+
+        :param self:
+            Self
+
+        :raise AtError:
+            Failed to send shutdown command
+
+        :return none:
+        """
+
         # Tell the modem to shutdown
         try:
             self.at.sendCommand("AT#SHUTDOWN")
         except at.Interface.CommError:
             raise modem.AtError(None, "Failed to issue shutdown command")
 
+    def _finishShutdown(self) -> None:
+        """Waits for the modem to finish gracefully shutting down
+
+        :param self:
+            Self
+
+        :raise AtError:
+            Failed to get +SHUTDOWN URC
+
+        :return none:
+        """
+
         # Wait for the +SHUTDOWN URC
         try:
-            self.at.getUrc(pattern = r"\+SHUTDOWN")
+            self.at.getUrc(pattern = SkywireNano.ShutdownPattern)
         except at.Interface.CommError:
             raise modem.AtError(None, "Failed to get +SHUTDOWN URC")
 
@@ -139,14 +177,20 @@ class SkywireNano(skywire.Skywire):
         :return none:
         """
 
-        # Pull IO5 High in order to enter recovery on next boot
-        self.host.gpio.write("IO5", True)
-
-        # Shut down the modem safely
+        # Start shutting down the modem safely
         #
         # Note: We must do a shutdown, then a reset. A reboot doesn't seem to be
         # reliable.
-        self.shutdown()
+        self._startShutdown()
+
+        # Pull IO5 High in order to enter recovery on next boot
+        #
+        # This only matters once we reset, so do it while the modem is busy
+        # shutting down.
+        self.host.gpio.write("IO5", True)
+
+        # Wait for the shutdown to finish
+        self._finishShutdown()
 
         # Reset the modem
         self.reset()
@@ -32,6 +32,18 @@ class Socket(skywire.Socket):
 
         self.nano = nano
 
+    def _getAt(self):
+        """Gets the AT interface our sockets use
+
+        :param self:
+            Self
+
+        :return Interface:
+            The AT interface
+        """
+
+        return self.nano.at
+
     def __call__(self, *args, **kwargs):
         """Creates a new socket
 
@@ -336,5 +348,6 @@ class Socket(skywire.Socket):
             if size != len(fields[1]):
                 return bytearray()
 
-            # Return the data
-            return fields[1].encode()
+            # Return the data, getting back any bytes that weren't valid UTF-8
+            # as they were
+            return fields[1].encode(errors = "surrogateescape")
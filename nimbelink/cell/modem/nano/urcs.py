@@ -10,6 +10,9 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+import re
+import typing
+
 import nimbelink.cell.modem as modem
 
 class Urcs:
@@ -23,6 +26,9 @@ class Urcs:
         Prefix = "DFU"
         """The prefix to a DFU URC"""
 
+        Pattern: typing.Pattern = re.compile(f"{Prefix}: ")
+        """A pattern for filtering DFU URCs"""
+
         class Type:
             Failure     = 0
             """A failure has occurred"""
@@ -33,7 +33,10 @@ class App:
         modem.app[0].version ...
 
     If an app doesn't yet know its version and it wasn't known at the time of
-    instantiation, it will attempt to query the version.
+    instantiation, it will attempt to query the version. A queried version is
+    remembered until the app is invalidated, such as after a firmware update:
+
+        modem.app[0].invalidate()
     """
 
     class Instance:
@@ -64,12 +67,35 @@ class App:
             self.name = name
 
             self._version = version
+            self._queriedVersion = None
 
             self._app = None
 
         def __str__(self) -> str:
             """Gets a string representation of us
 
+            This won't query our version if we don't already know it.
+
+            :param self:
+                Self
+
+            :return str:
+                Us
+            """
+
+            version = self._version
+
+            if version is None:
+                version = self._queriedVersion
+
+            if version is None:
+                version = "<unqueried>"
+
+            return f"{self.id} ({self.name}) : {version}"
+
+        def __repr__(self) -> str:
+            """Gets a representation of us
+
             :param self:
                 Self
 
@@ -77,7 +103,7 @@ class App:
                 Us
             """
 
-            return f"{self.id} ({self.name}) : {self.version}"
+            return f"{self.__class__.__name__}({self})"
 
         @property
         def version(self) -> str:
@@ -94,8 +120,25 @@ class App:
             if self._version is not None:
                 return self._version
 
-            # If we're getting our live version, always re-query it
-            return self._app._getVersion(app = self)
+            # If we haven't queried our live version yet, do so once and hang
+            # on to it
+            if self._queriedVersion is None:
+                self._queriedVersion = self._app._getVersion(app = self)
+
+            return self._queriedVersion
+
+        def invalidate(self) -> None:
+            """Forgets any version we previously queried
+
+            The next access of our version will query it again.
+
+            :param self:
+                Self
+
+            :return none:
+            """
+
+            self._queriedVersion = None
 
     def __init__(self, apps: typing.List["App.Instance"]) -> None:
         """Creates a new app sub-module
@@ -113,6 +156,25 @@ class App:
 
         self._apps = apps
 
+        self._byId: typing.Dict[int, "App.Instance"] = {}
+        self._byName: typing.Dict[str, "App.Instance"] = {}
+
+        self._ambiguousIds: typing.Set[int] = set()
+        self._ambiguousNames: typing.Set[str] = set()
+
+        # Build our lookups once up front, noting any keys that are shared by
+        # more than one app so we can refuse to resolve them later
+        for app in apps:
+            if app.id in self._byId:
+                self._ambiguousIds.add(app.id)
+            else:
+                self._byId[app.id] = app
+
+            if app.name in self._byName:
+                self._ambiguousNames.add(app.name)
+            else:
+                self._byName[app.name] = app
+
     def __len__(self) -> int:
         """Gets the number of apps available
 
@@ -142,22 +204,37 @@ class App:
             The app
         """
 
-        if isinstance(key, str):
-            apps = [app for app in self._apps if app.name == key]
+        if isinstance(key, int):
+            apps = self._byId
+            ambiguous = self._ambiguousIds
 
-        elif isinstance(key, int):
-            apps = [app for app in self._apps if app.id == key]
+        elif isinstance(key, str):
+            apps = self._byName
+            ambiguous = self._ambiguousNames
 
         else:
             raise TypeError(f"Invalid type {type(key)} for app")
 
-        if len(apps) < 1:
+        if key in ambiguous:
+            raise KeyError(f"{key} is ambiguous in apps")
+
+        try:
+            return apps[key]
+
+        except KeyError:
             raise KeyError(f"Failed to find {key} in apps")
 
-        if len(apps) > 1:
-            raise KeyError(f"{key} is ambiguous in apps")
+    def invalidate(self) -> None:
+        """Forgets all of our apps' queried versions
+
+        :param self:
+            Self
+
+        :return none:
+        """
 
-        return apps[0]
+        for app in self._apps:
+            app.invalidate()
 
     def _getVersion(self, app: "App.Instance") -> str:
         """Gets an application's version
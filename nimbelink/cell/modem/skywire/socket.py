@@ -10,9 +10,14 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+import asyncio
+import functools
 import socket
+import sys
 import typing
 
+import nimbelink.cell.at as at
+
 class Socket(object):
     """A Skywire socket factory
     """
@@ -21,15 +26,60 @@ class Socket(object):
         """A usable socket object
         """
 
+        # We don't hold any state ourselves, so leave it up to implementations
+        # whether or not their instances need a __dict__
+        __slots__ = ()
+
         def __del__(self):
             """Destructs the socket instance
 
+            Closing the socket here is only a best effort. If the interpreter is
+            shutting down, the modem may no longer be reachable, so we won't
+            try at all. Use the socket as a context manager or close it
+            explicitly to be sure it's closed.
+
             :param self:
                 Self
 
             :return none:
             """
 
+            if sys.is_finalizing():
+                return
+
+            try:
+                self.close()
+
+            except Exception:
+                pass
+
+        def __enter__(self) -> "Socket.Instance":
+            """Enters the socket context
+
+            :param self:
+                Self
+
+            :return Socket.Instance:
+                Us
+            """
+
+            return self
+
+        def __exit__(self, type, value, traceback) -> None:
+            """Exits the socket context, closing the socket
+
+            :param self:
+                Self
+            :param type:
+                The type of exception, if any
+            :param value:
+                The value of the exception, if any
+            :param traceback:
+                The exception's traceback, if any
+
+            :return none:
+            """
+
             self.close()
 
         def create(
@@ -119,6 +169,185 @@ class Socket(object):
 
             raise NotImplementedError(f"recv() not implemented by {self.__class__.__name__}")
 
+    class AsyncInstance:
+        """A socket object usable from asyncio
+
+        Each operation runs its underlying socket instance's operation on its
+        AT interface's single worker thread, which keeps AT commands for a
+        modem in order while letting the event loop carry on with other work.
+        """
+
+        def __init__(
+            self,
+            instance: "Socket.Instance",
+            factory: "Socket"
+        ) -> None:
+            """Creates a new asyncio socket instance
+
+            :param self:
+                Self
+            :param instance:
+                The socket instance to wrap
+            :param factory:
+                The factory that made the socket instance
+
+            :return none:
+            """
+
+            self.instance = instance
+
+            self._factory = factory
+
+        async def _run(self, function: typing.Callable, *args) -> typing.Any:
+            """Runs a socket operation on our AT interface's worker
+
+            :param self:
+                Self
+            :param function:
+                The operation to run
+            :param *args:
+                Positional arguments for the operation
+
+            :return typing.Any:
+                The operation's result
+            """
+
+            # Look up the worker every time, as the AT interface can shut it
+            # down and replace it
+            return await asyncio.get_running_loop().run_in_executor(
+                self._factory._getAt().executor,
+                functools.partial(function, *args)
+            )
+
+        async def __aenter__(self) -> "Socket.AsyncInstance":
+            """Enters the socket context
+
+            :param self:
+                Self
+
+            :return Socket.AsyncInstance:
+                Us
+            """
+
+            return self
+
+        async def __aexit__(self, type, value, traceback) -> None:
+            """Exits the socket context, closing the socket
+
+            :param self:
+                Self
+            :param type:
+                The type of exception, if any
+            :param value:
+                The value of the exception, if any
+            :param traceback:
+                The exception's traceback, if any
+
+            :return none:
+            """
+
+            await self.close()
+
+        async def close(self) -> None:
+            """Closes the socket
+
+            :param self:
+                Self
+
+            :return none:
+            """
+
+            await self._run(self.instance.close)
+
+        async def connect(self, address: typing.Tuple[str, int]) -> None:
+            """Connects to an address
+
+            :param self:
+                Self
+            :param address:
+                A tuple of the host string and port number
+
+            :raise OSError:
+                Failed to connect socket
+
+            :return none:
+            """
+
+            await self._run(self.instance.connect, address)
+
+        async def send(self, bytes: bytearray) -> int:
+            """Sends data to the socket
+
+            :param self:
+                Self
+            :param bytes:
+                The data to send
+
+            :return Integer:
+                The number of bytes sent
+            """
+
+            return await self._run(self.instance.send, bytes)
+
+        async def recv(self, bufsize: int) -> bytearray:
+            """Receives data from the socket
+
+            :param self:
+                Self
+            :param bufsize:
+                The amount of data to receive
+
+            :return bytearray:
+                The received data
+            """
+
+            return await self._run(self.instance.recv, bufsize)
+
+    async def createAsync(self, *args, **kwargs) -> "Socket.AsyncInstance":
+        """Creates a new socket usable from asyncio
+
+        All asyncio sockets from this factory share the AT interface's single
+        worker thread for talking to the modem, along with anything else using
+        the AT interface from asyncio.
+
+        :param self:
+            Self
+        :param *args:
+            Positional arguments
+        :param **kwargs:
+            Keyword arguments
+
+        :raise OSError:
+            Failed to create new socket
+
+        :return None:
+            Failed to create socket
+        :return Socket.AsyncInstance:
+            The socket
+        """
+
+        instance = await asyncio.get_running_loop().run_in_executor(
+            self._getAt().executor,
+            functools.partial(self, *args, **kwargs)
+        )
+
+        if instance is None:
+            return None
+
+        return Socket.AsyncInstance(instance = instance, factory = self)
+
+    def _getAt(self) -> "at.Interface":
+        """Gets the AT interface our sockets use
+
+        :param self:
+            Self
+
+        :return at.Interface:
+            The AT interface
+        """
+
+        raise NotImplementedError(f"_getAt() not implemented by {self.__class__.__name__}")
+
     def __call__(self, *args, **kwargs) -> "Socket.Instance":
         """Creates a new socket
 
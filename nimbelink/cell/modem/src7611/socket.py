@@ -14,6 +14,7 @@ import re
 import socket
 import typing
 
+import nimbelink.cell.at as at
 import nimbelink.cell.modem as modem
 import nimbelink.cell.modem.skywire as skywire
 
@@ -24,6 +25,15 @@ class Socket(skywire.Socket):
     EOFPattern: bytes = b"--EOF--Pattern--"
     """The default EOF pattern for AT+KPATTERN"""
 
+    EOFString: str = EOFPattern.decode()
+    """The default EOF pattern for AT+KPATTERN, as seen in text output"""
+
+    EOFLength: int = len(EOFPattern)
+    """The length of the default EOF pattern"""
+
+    Mtu: int = 1500
+    """The most data the modem will generally handle at once"""
+
     def __init__(self, src7611: "modem.src7611.SRC7611") -> None:
         """Creates a new socket sub-module
 
@@ -37,6 +47,34 @@ class Socket(skywire.Socket):
 
         self.modem: "modem.src7611.SRC7611" = src7611
 
+        self._cnxcfgVerified: bool = False
+
+    def invalidateCnxcfg(self) -> None:
+        """Forgets that AT+KCNXCFG was verified
+
+        The next socket creation will make sure AT+KCNXCFG is configured again,
+        which is useful if the configuration was changed.
+
+        :param self:
+            Self
+
+        :return none:
+        """
+
+        self._cnxcfgVerified = False
+
+    def _getAt(self) -> "at.Interface":
+        """Gets the AT interface our sockets use
+
+        :param self:
+            Self
+
+        :return at.Interface:
+            The AT interface
+        """
+
+        return self.modem.at
+
     def __call__(self, *args, **kwargs) -> "Socket.Instance":
         """Creates a new socket
 
@@ -66,6 +104,24 @@ class Socket(skywire.Socket):
         """A usable NL-SW-LTE-SRC7611 socket instance
         """
 
+        ConnectToken: str = "CONNECT"
+        """The token preceding socket data"""
+
+        ConnectPattern: typing.Pattern = re.compile(ConnectToken.encode())
+        """The pattern for the prompt to send socket data"""
+
+        DataStartToken: str = ConnectToken + "\r\n"
+        """The token immediately preceding received socket data"""
+
+        DataStartLength: int = len(DataStartToken)
+        """The length of the token immediately preceding received socket data"""
+
+        OkSuffix: bytes = b"OK\r\n"
+        """The successful result after sending socket data"""
+
+        ConfigPattern: typing.Pattern = re.compile(r"\+KTCPCFG:\s*(\d+)")
+        """The pattern for the session ID of a newly-configured socket"""
+
         def __init__(self, src7611: "modem.src7611.SRC7611") -> None:
             """Creates a new socket instance
 
@@ -82,8 +138,16 @@ class Socket(skywire.Socket):
             self.sessionId: int = None
             self.type = None
 
+            # Our session's send and receive command prefixes, once we have a
+            # session
+            self._sendPrefix: str = None
+            self._recvPrefix: str = None
+
             self.recvTimeout = 60
 
+            # A buffer for staging outgoing data along with the EOF pattern
+            self._sendBuffer = bytearray(Socket.Mtu + Socket.EOFLength)
+
         def delete(self) -> None:
             """Deletes the socket on the modem
 
@@ -97,13 +161,29 @@ class Socket(skywire.Socket):
             if self.sessionId is None:
                 return None
 
+            self._delete(sessionId = self.sessionId)
+
+        def _delete(self, sessionId: int) -> None:
+            """Deletes a socket session on the modem
+
+            :param self:
+                Self
+            :param sessionId:
+                The session to delete
+
+            :raise AtError:
+                Failed to delete the session
+
+            :return none:
+            """
+
             # Delete the socket on the modem
-            result = self.modem.at.sendCommand(f"AT+KTCPDEL={self.sessionId}")
+            result = self.modem.at.sendCommand(f"AT+KTCPDEL={sessionId}")
 
             # Check the result to ensure it didn't fail
             if not result:
                 raise modem.AtError(
-                    f"Failed to delete socket {self.sessionId}"
+                    result, f"Failed to delete socket {sessionId}"
                 )
 
         def create(
@@ -138,6 +218,10 @@ class Socket(skywire.Socket):
             :return none:
             """
 
+            # If we already verified the GPRS configuration, nothing to do
+            if self.modem.socket._cnxcfgVerified:
+                return
+
             # Verify that the GPRS configuration is set
             #
             # If KCNXCFG is not configured the modem does not know how to
@@ -152,6 +236,9 @@ class Socket(skywire.Socket):
             if "+KCNXCFG:" not in response:
                 raise modem.Error("AT+KCNXCFG must be configured")
 
+            # Don't bother checking again for future sockets
+            self.modem.socket._cnxcfgVerified = True
+
         def close(self) -> None:
             """Closes the socket
 
@@ -161,13 +248,21 @@ class Socket(skywire.Socket):
             :return none:
             """
 
-            if self.sessionId != None:
-                self.modem.at.sendCommand(f"AT+KTCPCLOSE={self.sessionId}")
+            if self.sessionId is None:
+                return
+
+            sessionId = self.sessionId
+
+            # Forget our session before talking to the modem, so a failure
+            # can't lead to trying to close it again
+            self.sessionId = None
+            self._sendPrefix = None
+            self._recvPrefix = None
 
-                # Delete the socket from the modem
-                self.delete()
+            self.modem.at.sendCommand(f"AT+KTCPCLOSE={sessionId}")
 
-                self.sessionId = None
+            # Delete the socket from the modem
+            self._delete(sessionId = sessionId)
 
         def connect(self, address: typing.Tuple[str, int]) -> None:
             """Creates a new socket and connects to an address
@@ -199,10 +294,13 @@ class Socket(skywire.Socket):
                 raise modem.AtError("Failed to create new socket on modem")
 
             # Set the session id from the modem's response
-            for line in response.lines:
-                if "+KTCPCFG: " in line:
-                    self.sessionId = int(line.split(" ")[1])
-                    break
+            match = Socket.Instance.ConfigPattern.search(response.output)
+
+            if match is not None:
+                self.sessionId = int(match.group(1))
+
+                self._sendPrefix = f"AT+KTCPSND={self.sessionId},"
+                self._recvPrefix = f"AT+KTCPRCV={self.sessionId},"
 
             # If we couldn't find the socket session id, raise an exception
             if self.sessionId is None:
@@ -219,11 +317,16 @@ class Socket(skywire.Socket):
             if not response:
                 raise modem.AtError(response, "Failed to initiate connection")
 
+            indication = re.compile(f"\\+KTCP_IND: {self.sessionId},1")
+
+            # If the connection indication already came in along with the
+            # command's response, there's nothing left to wait for
+            if indication.search(response.output) is not None:
+                return
+
             # Wait for the modem to connect to the remote server for up to 10
             # seconds
-            response = self.modem.at.getUrc(
-                f"\\+KTCP_IND: {self.sessionId},1", 10
-            )
+            response = self.modem.at.getUrc(indication, 10)
 
             # Ensure we got a response
             if not response:
@@ -231,37 +334,54 @@ class Socket(skywire.Socket):
                     "Socket failed to connect to remote server."
                 )
 
-        def send(self, bytes: bytes) -> int:
+        def send(self, bytes: typing.Union[bytes, bytearray, memoryview]) -> int:
             """Sends data to the socket
 
             :param self:
                 Self
             :param bytes:
-                The data to send
+                The data to send, which can be anything supporting the buffer
+                protocol
+
+            :raise OSError:
+                Socket is not connected
 
             :return int:
                 The number of bytes sent
             """
 
+            if self.sessionId is None:
+                raise OSError("Socket is not connected")
+
+            size = len(bytes)
+
             # Start the sending process by starting the TCP send command
-            self.modem.at._beginCommand(f"AT+KTCPSND={self.sessionId},{len(bytes)}")
+            self.modem.at._beginCommand(self._sendPrefix + str(size))
 
             # Wait for the CONNECT prompt to be sent
-            if not self.modem.at.waitForPattern(re.compile("CONNECT")):
+            if not self.modem.at.waitForPattern(Socket.Instance.ConnectPattern):
                 raise modem.AtError("Failed to get CONNECT string")
 
-            # Send the payload to the modem
-            self.modem.at._writeRaw(bytes)
+            total = size + Socket.EOFLength
+
+            # If our staging buffer isn't big enough for this, make a bigger one
+            if len(self._sendBuffer) < total:
+                self._sendBuffer = bytearray(total)
+
+            # Stage the payload followed by the EOF pattern
+            self._sendBuffer[:size] = bytes
+            self._sendBuffer[size:total] = Socket.EOFPattern
 
-            # Send the EOF pattern to the modem
-            self.modem.at._writeRaw(Socket.EOFPattern)
+            # Send it all to the modem in a single write
+            with memoryview(self._sendBuffer) as view:
+                self.modem.at._writeRaw(view[:total])
 
             # Ensure we were successful in sending the bytes to the modem
-            if not self.modem.at.waitForPattern(re.compile("OK\r\n")):
+            if not self.modem.at.waitForSuffix(Socket.Instance.OkSuffix):
                 raise modem.AtError("Failed to send bytes")
 
             # Return the number of bytes that were sent
-            return len(bytes)
+            return size
 
         def recv(self, bufsize: int) -> bytearray:
             """Receives data from the socket
@@ -277,17 +397,23 @@ class Socket(skywire.Socket):
             :param bufsize:
                 The amount of data to receive
 
+            :raise OSError:
+                Socket is not connected
+
             :return bytearray:
                 The received data
             """
 
+            if self.sessionId is None:
+                raise OSError("Socket is not connected")
+
             # Send the TCP data receive command with the size of the buffer to
             # receive
             #
             # The modem will send the max of the buffer size or the number of
             # bytes it currently has.
             response = self.modem.at.sendCommand(
-                f"AT+KTCPRCV={self.sessionId},{bufsize}",
+                self._recvPrefix + str(bufsize),
                 timeout = self.recvTimeout + 5,
             )
 
@@ -301,7 +427,7 @@ class Socket(skywire.Socket):
             # since we just have to find the positions of two strings.
 
             # Find the start of the data output
-            start: int = response.output.find("CONNECT")
+            start: int = response.output.find(Socket.Instance.DataStartToken)
 
             # If we didn't find the start of the data, raise an exception
             if start < 0:
@@ -309,8 +435,11 @@ class Socket(skywire.Socket):
                     "Unable to find starting CONNECT in output from socket receive operation"
                 )
 
-            # Find the end of the data output
-            end: int = response.output.rfind(Socket.EOFPattern.decode())
+            # Skip past the starting CONNECT token
+            start += Socket.Instance.DataStartLength
+
+            # Find the end of the data output, which can't come before its start
+            end: int = response.output.rfind(Socket.EOFString, start)
 
             # If we didn't find the end of the data, raise an exception
             if end < 0:
@@ -318,8 +447,9 @@ class Socket(skywire.Socket):
                     "Unable to find EOF pattern in output from socket receive operation"
                 )
 
-            # Increment the start past the starting CONNECT token
-            start += 9
-
-            # Return only the contents of the received data
-            return bytearray(response.output[start:end].encode())
+            # Return only the contents of the received data, encoding it
+            # straight into the returned buffer
+            #
+            # The AT interface keeps any bytes that weren't valid UTF-8 as
+            # surrogates, so this gives back exactly what the modem sent.
+            return bytearray(response.output[start:end], "utf-8", "surrogateescape")
@@ -10,10 +10,14 @@ party license terms as specified in this software, and such portions are
 excluded from the preceding copyright notice of NimbeLink Corp.
 """
 
+import collections
 import re
 import socket
+import threading
 import typing
+import weakref
 
+import nimbelink.cell.at as at
 import nimbelink.cell.modem as modem
 import nimbelink.cell.modem.skywire as skywire
 
@@ -25,6 +29,36 @@ class Socket(skywire.Socket):
         """A usable socket object
         """
 
+        __slots__ = (
+            "factory",
+            "connId",
+            "isOpen",
+            "_sendPrefix",
+            "_recvPrefix",
+            "_recvBuffer",
+            "_commandBuffer",
+            "__weakref__",
+        )
+
+        PromptPattern: typing.Pattern = re.compile(b"> ")
+        """The pattern for the prompt to send socket data"""
+
+        OkSuffix: bytes = b"OK\r\n"
+        """The successful result after receiving socket data"""
+
+        RecvPattern: typing.Pattern = re.compile(r"#SRECV: \d+,(\d+)|(?:\+CM[ES] )?ERROR")
+        """The pattern for either the size of received socket data or a failure
+        to receive it"""
+
+        MaxSendSize: int = 1500
+        """The most data AT#SSENDEXT can send at once"""
+
+        MaxRecvSize: int = 1500
+        """The most data AT#SRECV can receive at once"""
+
+        CommandNewLine: bytes = b"\r\n"
+        """The line ending for the socket commands we write directly"""
+
         def __init__(self, factory: "Socket") -> None:
             """Creates a new socket instance
 
@@ -38,25 +72,27 @@ class Socket(skywire.Socket):
 
             self.factory: "Socket" = factory
 
-            # If there is a connection ID available, grab it
-            if len(self.factory.availableConnIds) > 0:
-                self.connId = self.factory.availableConnIds.pop()
+            self.connId: int = None
 
-            else:
-                self.connId: int = None
+            # If there is a connection ID available, grab it
+            with self.factory._connIdLock:
+                if len(self.factory.availableConnIds) > 0:
+                    self.connId = self.factory.availableConnIds.popleft()
 
-            self.isOpen: bool = False
+            # Our connection's send and receive command prefixes
+            self._sendPrefix: bytes = f"AT#SSENDEXT={self.connId},".encode()
+            self._recvPrefix: bytes = f"AT#SRECV={self.connId},".encode()
 
-        def __del__(self):
-            """Destructs the socket instance
+            # A buffer for assembling those commands
+            self._commandBuffer = bytearray()
 
-            :param self:
-                Self
+            # A buffer for receiving data into
+            self._recvBuffer = bytearray(Socket.Instance.MaxRecvSize)
 
-            :return none:
-            """
+            self.isOpen: bool = False
 
-            self.close()
+            # Let our factory know about us, in case it needs to close us
+            self.factory._instances.add(self)
 
         def create(
             self,
@@ -94,6 +130,31 @@ class Socket(skywire.Socket):
 
             return None
 
+        def _writeCommand(self, prefix: bytes, size: int) -> None:
+            """Writes one of our sized socket commands directly to the modem
+
+            :param self:
+                Self
+            :param prefix:
+                The command's prefix
+            :param size:
+                The size to request in the command
+
+            :raise CommError:
+                Failed to write command
+
+            :return none:
+            """
+
+            command = self._commandBuffer
+
+            command.clear()
+            command += prefix
+            command += b"%d" % size
+            command += Socket.Instance.CommandNewLine
+
+            self.factory.modem.at._writeRaw(command)
+
         def close(self) -> None:
             """Closes the socket
 
@@ -116,10 +177,12 @@ class Socket(skywire.Socket):
                 )
 
             # Add the connection ID back to the list of available sockets
-            self.factory.availableConnIds.append(self.connId)
+            with self.factory._connIdLock:
+                self.factory.availableConnIds.append(self.connId)
 
             # Nullify the current ID
             self.connId = None
+            self.isOpen = False
 
         def connect(self, address: typing.Tuple[str, int]) -> None:
             """Connects to an address
@@ -152,6 +215,10 @@ class Socket(skywire.Socket):
 
             # Check that opening the socket was successful
             if not result:
+                # Our PDP context might have gone away, so make sure the next
+                # socket checks again
+                self.factory.invalidateContexts()
+
                 raise OSError(f"Socket failed to connect to {address}")
 
             # Set the isOpen flag
@@ -160,6 +227,9 @@ class Socket(skywire.Socket):
         def send(self, bytes: bytearray) -> int:
             """Sends data to the socket
 
+            Like a regular socket, not all of the data may be sent if there is
+            more than the modem can take at once.
+
             :param self:
                 Self
             :param bytes:
@@ -179,13 +249,15 @@ class Socket(skywire.Socket):
             if not self.isOpen:
                 raise OSError("Connection must be open in order to send data")
 
+            # Only send as much as the modem can take
+            if len(bytes) > Socket.Instance.MaxSendSize:
+                bytes = memoryview(bytes)[:Socket.Instance.MaxSendSize]
+
             # Write the command to request to send data to the modem
-            self.factory.modem.at._writeRaw(
-                f"AT#SSENDEXT={self.connId},{len(bytes)}\r\n".encode()
-            )
+            self._writeCommand(prefix = self._sendPrefix, size = len(bytes))
 
             # Wait for the prompt to appear
-            if not self.factory.modem.at.waitForPattern(re.compile("> "), 5):
+            if not self.factory.modem.at.waitForPattern(Socket.Instance.PromptPattern, 5):
                 raise modem.AtError("Failed to get prompt for sending")
 
             # Write the raw bytes into the socket
@@ -196,6 +268,27 @@ class Socket(skywire.Socket):
             # Return the bytes we wrote
             return len(bytes)
 
+        def sendall(self, bytes: bytearray) -> None:
+            """Sends all data to the socket
+
+            The modem returns to command mode on its own after each send, so
+            each chunk of data is sent right after the previous one without
+            waiting on any further responses.
+
+            :param self:
+                Self
+            :param bytes:
+                The data to send
+
+            :return none:
+            """
+
+            with memoryview(bytes) as view:
+                offset = 0
+
+                while offset < len(view):
+                    offset += self.send(view[offset:])
+
         def recv(self, bufsize: int) -> bytearray:
             """Receives data from the socket.
 
@@ -205,37 +298,81 @@ class Socket(skywire.Socket):
                 The amount of data to receive.
                 Range: 1-1500 bytes
 
+            :raise ValueError:
+                The amount of data is out of range
+
             :return bytearray:
                 The received data
             """
 
             # Ensure the buffer size is within range
-            if (bufsize < 1) or (bufsize > 1500):
+            if (bufsize < 1) or (bufsize > Socket.Instance.MaxRecvSize):
                 raise ValueError("bufsize must be between 1 and 1500 bytes")
 
-            # Request that the modem send us up to bufsize bytes
-            self.factory.modem.at._writeRaw(
-                f"AT#SRECV={self.connId},{bufsize}\r\n".encode()
-            )
+            size = self.recv_into(self._recvBuffer, bufsize)
+
+            # Hand back our own copy of the data
+            return self._recvBuffer[:size]
+
+        def recv_into(self, buffer: bytearray, nbytes: int = 0) -> int:
+            """Receives data from the socket directly into a buffer
+
+            :param self:
+                Self
+            :param buffer:
+                The writable buffer to receive data into
+            :param nbytes:
+                The amount of data to receive, or 0 for as much as the buffer
+                can hold, up to the maximum
+                Range: 1-1500 bytes
+
+            :raise ValueError:
+                The amount of data is out of range or won't fit in the buffer
+
+            :return int:
+                The number of bytes received
+            """
+
+            if nbytes == 0:
+                nbytes = min(len(buffer), Socket.Instance.MaxRecvSize)
+
+            # Don't ask the modem for more data than the buffer can hold
+            elif nbytes > len(buffer):
+                raise ValueError("nbytes must not be larger than the buffer")
+
+            # Ensure the buffer size is within range
+            if (nbytes < 1) or (nbytes > Socket.Instance.MaxRecvSize):
+                raise ValueError("bufsize must be between 1 and 1500 bytes")
+
+            # Request that the modem send us up to nbytes bytes
+            self._writeCommand(prefix = self._recvPrefix, size = nbytes)
 
             # The size of data being returned
             size: int = 0
 
-            # Parse how many bytes the modem is giving to us
+            # Parse how many bytes the modem is giving to us, stopping early if
+            # the modem tells us it failed
             for line in self.factory.modem.at._getLines(5):
-                if "#SRECV: " in line:
-                    size = int(line.split(",")[1].strip())
-                    break
+                match = Socket.Instance.RecvPattern.match(line)
 
-            # Read the data from the modem
-            data: bytes = self.factory.modem.at._readRaw(size)
+                if match is None:
+                    continue
+
+                if match.group(1) is None:
+                    raise OSError(f"Modem failed to receive data ({line.strip()})")
+
+                size = int(match.group(1))
+                break
+
+            # Read the data from the modem straight into the buffer
+            with memoryview(buffer) as view:
+                size = self.factory.modem.at._readRawInto(view[:size])
 
             # Make sure we get the OK result from the modem
-            if not self.factory.modem.at.waitForPattern(re.compile("OK\r\n")):
+            if not self.factory.modem.at.waitForSuffix(Socket.Instance.OkSuffix, 5):
                 raise OSError("Failed to seek to OK after socket recv()")
 
-            # Cast the data to a mutable bytearray to match return types
-            return bytearray(data)
+            return size
 
     def __init__(self, tg1wwg: "modem.tg1wwg.TG1WWG") -> None:
         """Creates a new socket factory
@@ -251,10 +388,72 @@ class Socket(skywire.Socket):
         super().__init__()
 
         # The available connection IDs that the modem can use
-        self.availableConnIds: typing.List[int] = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        self.availableConnIds: typing.Deque[int] = collections.deque(range(1, 11))
+        self._connIdLock = threading.Lock()
 
         self.modem: "modem.tg1wwg.TG1WWG" = tg1wwg
 
+        self._contextsActive: bool = False
+
+        # The socket instances we've handed out
+        self._instances: "weakref.WeakSet[Socket.Instance]" = weakref.WeakSet()
+
+    def closeAll(self) -> None:
+        """Closes all sockets from this factory
+
+        All of the sockets are shut down with a single chained AT command,
+        rather than a command for each socket.
+
+        :param self:
+            Self
+
+        :raise AtError:
+            Failed to shut down a socket
+
+        :return none:
+        """
+
+        instances = [instance for instance in list(self._instances) if instance.connId is not None]
+
+        # If there's nothing to close, nothing to do
+        if len(instances) < 1:
+            return
+
+        command = "AT" + ";".join(f"#SH={instance.connId}" for instance in instances)
+
+        # Request that the modem shuts down all of the sockets
+        result = self.modem.at.sendCommand(command)
+
+        # If that failed, we can't know which sockets were actually shut down,
+        # so fall back to closing them individually
+        if not result:
+            for instance in instances:
+                instance.close()
+
+            return
+
+        # Add the connection IDs back to the list of available sockets
+        with self._connIdLock:
+            for instance in instances:
+                self.availableConnIds.append(instance.connId)
+
+                instance.connId = None
+                instance.isOpen = False
+
+    def invalidateContexts(self) -> None:
+        """Forgets that PDP contexts were active
+
+        The next socket creation will make sure a PDP context is active again,
+        which is useful if the modem's PDP contexts may have changed.
+
+        :param self:
+            Self
+
+        :return none:
+        """
+
+        self._contextsActive = False
+
     def _activeContexts(self) -> int:
         """Checks how many contexts are active on the modem
 
@@ -276,15 +475,11 @@ class Socket(skywire.Socket):
         # Count the number of active PDP contexts
         for line in response.lines:
             # Only process lines that are reporting a context state
-            if "#SGACT: " not in line:
+            if not line.startswith("#SGACT:"):
                 continue
 
-            splitLine = line.split(",")
-
-            state: int = int(splitLine[1].strip())
-
-            # Count the active contexts
-            if state == 1:
+            # Count the active contexts, whose state follows their context ID
+            if line.rstrip().endswith(",1"):
                 activeContexts += 1
 
         # Return the number of active PDP contexts
@@ -301,21 +496,40 @@ class Socket(skywire.Socket):
         :return none:
         """
 
+        # If we already know we have an active context, nothing to do
+        if self._contextsActive:
+            return
+
         # If we already have an active context, skip trying to activate others
         if self._activeContexts() > 0:
+            self._contextsActive = True
             return
 
         # Try activating the first context for AT&T APNs
         if self.modem.at.sendCommand("AT#SGACT=1,1"):
+            self._contextsActive = True
             return
 
         # Try activating the third context for Verizon APNs
         if self.modem.at.sendCommand("AT#SGACT=3,1"):
+            self._contextsActive = True
             return
 
         # Raise an error if none were activated
         raise OSError("Failed to activate PDP context")
 
+    def _getAt(self) -> "at.Interface":
+        """Gets the AT interface our sockets use
+
+        :param self:
+            Self
+
+        :return at.Interface:
+            The AT interface
+        """
+
+        return self.modem.at
+
     def __call__(self, *args, **kwargs) -> "Socket.Instance":
         """Creates a new socket
 